@@ -1,9 +1,70 @@
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
-from bs4 import BeautifulSoup
+from lxml import etree
 from dateutil import parser as date_parser
 import email.utils as email_utils   # for RFC 822 formatting
 import datetime
+import os
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+# Clark-notation tag names of the Atom elements we convert
+ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+ATOM_SUBTITLE = f"{{{ATOM_NS}}}subtitle"
+ATOM_TITLE = f"{{{ATOM_NS}}}title"
+ATOM_LINK = f"{{{ATOM_NS}}}link"
+ATOM_PUBLISHED = f"{{{ATOM_NS}}}published"
+ATOM_UPDATED = f"{{{ATOM_NS}}}updated"
+ATOM_CONTENT = f"{{{ATOM_NS}}}content"
+FEED_TAGS = (ATOM_TITLE, ATOM_LINK, ATOM_SUBTITLE, ATOM_ENTRY)
+CONTENT_ENCODED = f"{{{CONTENT_NS}}}encoded"
+CONTENT_NSMAP = {"content": CONTENT_NS}
+
+def parse_atom_date(date_str):
+    """Parse an Atom (RFC 3339) timestamp, e.g. 2017-06-28T08:15:00.001-07:00."""
+    # Fast path: fromisoformat is implemented in C and covers RFC 3339 on 3.11+
+    try:
+        return datetime.datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    # Older Pythons reject a trailing "Z" designator
+    if date_str[-1:] in ("Z", "z"):
+        try:
+            return datetime.datetime.fromisoformat(date_str[:-1] + "+00:00")
+        except ValueError:
+            pass
+    # Slow path for anything fromisoformat can't handle
+    return date_parser.isoparse(date_str)
+
+class FeedReadError(Exception):
+    """The Atom input could not be read partway through parsing."""
+
+def parse_feed(f_in):
+    """Create an iterparse context for the feed-level tags and entries we convert."""
+    # Only the tags we convert are reported, and comment/PI nodes are
+    # never built since nothing reads them. Like BeautifulSoup's "xml"
+    # builder, recover from malformed input (undefined entities such as
+    # &nbsp;, truncated files) and convert whatever could be parsed
+    return etree.iterparse(f_in, events=("end",), tag=FEED_TAGS,
+                           remove_comments=True, remove_pis=True, recover=True)
+
+def iter_feed(feed_events):
+    """Yield the events of an iterparse context, wrapping read failures in FeedReadError."""
+    try:
+        yield from feed_events
+    except OSError as e:
+        # Tell read failures apart from failures writing the output
+        raise FeedReadError(e) from e
+
+@lru_cache(maxsize=4096)
+def atom_date_to_rfc822(date_str):
+    """Convert an Atom timestamp to an RFC 822 date, caching repeated values."""
+    return email_utils.format_datetime(parse_atom_date(date_str))
 
 class AtomToRSSConverterApp:
     def __init__(self, master):
@@ -14,6 +75,10 @@ class AtomToRSSConverterApp:
         self.input_file_path = None
         self.output_file_path = None
 
+        # Pending log lines, written to the log area in batches by flush_log()
+        self.log_buffer = []
+        self.log_flush_pending = False
+
         # Create GUI elements
         self.create_widgets()
 
@@ -29,17 +94,28 @@ class AtomToRSSConverterApp:
                                       command=self.select_output_file)
         btn_select_output.pack(side=tk.LEFT, padx=5)
 
-        btn_process = tk.Button(frame_buttons, text="Convert & Export",
-                                command=self.process_feed)
-        btn_process.pack(side=tk.LEFT, padx=5)
+        self.btn_process = tk.Button(frame_buttons, text="Convert & Export",
+                                     command=self.process_feed)
+        self.btn_process.pack(side=tk.LEFT, padx=5)
 
         # Scrolled text for logs
         self.log_area = scrolledtext.ScrolledText(self.master, width=80, height=20)
         self.log_area.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
 
     def log(self, message):
-        """Append a line to the log area."""
-        self.log_area.insert(tk.END, message + "\n")
+        """Queue a line for the log area; lines are flushed together every 100 ms."""
+        self.log_buffer.append(message)
+        if not self.log_flush_pending:
+            self.log_flush_pending = True
+            self.master.after(100, self.flush_log)
+
+    def flush_log(self):
+        """Append all queued lines to the log area with a single insert."""
+        self.log_flush_pending = False
+        if not self.log_buffer:
+            return
+        self.log_area.insert(tk.END, "\n".join(self.log_buffer) + "\n")
+        self.log_buffer.clear()
         self.log_area.see(tk.END)
 
     def select_input_file(self):
@@ -63,6 +139,74 @@ class AtomToRSSConverterApp:
             self.output_file_path = file_path
             self.log(f"Selected output file: {file_path}")
 
+    def build_item(self, entry):
+        """Convert a single Atom <entry> into an RSS <item> element."""
+        item_tag = etree.Element("item")
+
+        # Collect the fields we need in a single pass over the entry's children,
+        # keeping the first match of each like find() would
+        entry_title = alt_link = published_tag = updated_tag = content_tag = None
+        for child in entry:
+            tag = child.tag
+            if tag == ATOM_TITLE:
+                if entry_title is None:
+                    entry_title = child
+            elif tag == ATOM_LINK:
+                if alt_link is None and child.get("rel") == "alternate":
+                    alt_link = child
+            elif tag == ATOM_PUBLISHED:
+                if published_tag is None:
+                    published_tag = child
+            elif tag == ATOM_UPDATED:
+                if updated_tag is None:
+                    updated_tag = child
+            elif tag == ATOM_CONTENT:
+                if content_tag is None:
+                    content_tag = child
+
+        # 1) <title>
+        if entry_title is not None:
+            etree.SubElement(item_tag, "title").text = "".join(entry_title.itertext()).strip()
+
+        # 2) <link>
+        alt_href = alt_link.get("href") if alt_link is not None else None
+        if alt_href:
+            etree.SubElement(item_tag, "link").text = alt_href
+
+        # 3) <pubDate> (convert from <published> or <updated> to RFC822)
+        #    Example Atom date: 2017-06-28T08:15:00.001-07:00
+        #    Example RSS date: Wed, 28 Jun 2017 08:15:00 -0700
+        date_str = None
+        if published_tag is not None and published_tag.text:
+            date_str = published_tag.text.strip()
+        elif updated_tag is not None and updated_tag.text:
+            date_str = updated_tag.text.strip()
+
+        if date_str:
+            try:
+                rfc_822_date = atom_date_to_rfc822(date_str)
+                etree.SubElement(item_tag, "pubDate").text = rfc_822_date
+            except Exception:
+                pass
+
+        # 4) <content:encoded> with CDATA
+        #    Only text content is converted; <content> with child elements
+        #    (e.g. type="xhtml") or only whitespace is skipped
+        if (content_tag is not None and len(content_tag) == 0
+                and content_tag.text and content_tag.text.strip()):
+            raw_html = content_tag.text
+            # Items are written one at a time, so the <rss> declaration isn't in
+            # scope; declare the namespace here to keep the content: prefix
+            content_encoded = etree.SubElement(item_tag, CONTENT_ENCODED, nsmap=CONTENT_NSMAP)
+            # Wrap in CDATA, unless raw_html already contains "]]>" (which
+            # can't appear inside a CDATA section); lxml escapes it as text then
+            if "]]>" not in raw_html:
+                content_encoded.text = etree.CDATA(raw_html)
+            else:
+                content_encoded.text = raw_html
+
+        return item_tag
+
     def process_feed(self):
         """Convert the Atom feed into RSS 2.0 format."""
         if not self.input_file_path:
@@ -72,129 +216,149 @@ class AtomToRSSConverterApp:
             messagebox.showerror("Error", "No output file selected.")
             return
 
-        # Read input
+        # Run the conversion on a worker thread so the GUI stays responsive;
+        # lxml releases the GIL while parsing and serializing
+        self.btn_process.config(state=tk.DISABLED)
+        worker = threading.Thread(target=self.convert_feed,
+                                  args=(self.input_file_path, self.output_file_path),
+                                  daemon=True)
+        worker.start()
+
+    def convert_feed(self, input_file_path, output_file_path):
+        """Run write_rss() on the worker thread, then re-enable the Convert button."""
+        # Tk widgets must only be touched from the main thread, so every GUI
+        # update from here on is handed back to it with master.after()
         try:
-            with open(self.input_file_path, "r", encoding="utf-8") as f:
-                atom_data = f.read()
-        except Exception as e:
-            self.log(f"ERROR reading input file: {e}")
-            messagebox.showerror("File Read Error", str(e))
+            self.write_rss(input_file_path, output_file_path)
+        finally:
+            self.master.after(0, self.btn_process.config, {"state": tk.NORMAL})
+
+    def write_rss(self, input_file_path, output_file_path):
+        """Read the Atom feed at input_file_path and write RSS 2.0 to output_file_path."""
+        # Top-level channel data, filled in from the feed <title>, <link>, etc. as they are parsed
+        title_elem = etree.Element("title")
+        title_elem.text = "Atom to RSS Feed"
+        link_elem = etree.Element("link")
+        link_elem.text = "http://example.com"
+        desc_elem = etree.Element("description")
+        desc_elem.text = "Converted from Atom feed"
+        channel_header = (title_elem, link_elem, desc_elem)
+        header_seen = set()
+
+        try:
+            f_in = open(input_file_path, "rb")
+        except OSError as e:
+            self.master.after(0, self.log, f"ERROR reading input file: {e}")
+            self.master.after(0, messagebox.showerror, "File Read Error", str(e))
             return
 
-        # Parse as XML (Atom feed)
+        # Write into a temporary file next to the output and only move it into
+        # place once the whole feed has been converted, so a failed run never
+        # leaves a partial feed behind and the input may also be the output.
+        # The 1 MiB buffer coalesces xmlfile's many small writes into few large ones
         try:
-            atom_soup = BeautifulSoup(atom_data, "xml")
-        except Exception as e:
-            self.log(f"ERROR parsing XML: {e}")
-            messagebox.showerror("XML Parse Error", str(e))
+            f_out = tempfile.NamedTemporaryFile(
+                "wb", buffering=1 << 20, delete=False, prefix=".", suffix=".tmp",
+                dir=os.path.dirname(os.path.abspath(output_file_path)))
+        except OSError as e:
+            f_in.close()
+            self.master.after(0, self.log, f"ERROR writing output file: {e}")
+            self.master.after(0, messagebox.showerror, "Write Error", str(e))
             return
 
-        # Prepare a skeleton RSS feed
-        # (We'll build <channel> with items)
-        rss_soup = BeautifulSoup(features="xml")
-        rss_tag = rss_soup.new_tag("rss", version="2.0")
-        # Add the content:encoded namespace for RSS
-        rss_tag["xmlns:content"] = "http://purl.org/rss/1.0/modules/content/"
-        rss_soup.append(rss_tag)
-
-        channel_tag = rss_soup.new_tag("channel")
-        rss_tag.append(channel_tag)
-
-        # Populate top-level channel data from the feed <title>, <link>, etc.
-        feed_title = atom_soup.find("title")
-        feed_link = atom_soup.find("link", rel="alternate")
-        feed_subtitle = atom_soup.find("subtitle")
-
-        # <title>
-        title_value = feed_title.get_text(strip=True) if feed_title else "Atom to RSS Feed"
-        title_elem = rss_soup.new_tag("title")
-        title_elem.string = title_value
-        channel_tag.append(title_elem)
-
-        # <link>
-        link_value = feed_link["href"] if (feed_link and feed_link.has_attr("href")) else "http://example.com"
-        link_elem = rss_soup.new_tag("link")
-        link_elem.string = link_value
-        channel_tag.append(link_elem)
-
-        # <description>
-        desc_value = feed_subtitle.get_text(strip=True) if feed_subtitle else "Converted from Atom feed"
-        desc_elem = rss_soup.new_tag("description")
-        desc_elem.string = desc_value
-        channel_tag.append(desc_elem)
-
-        # Now convert each <entry> into an <item>
-        entries = atom_soup.find_all("entry")
+        # Stream-parse the Atom feed and stream-write the RSS feed: each <entry>
+        # is converted into an <item> and written out as soon as it is complete,
+        # so only one entry is held in memory on either side
         count_items = 0
-        for entry in entries:
-            item_tag = rss_soup.new_tag("item")
-
-            # 1) <title>
-            entry_title = entry.find("title")
-            if entry_title:
-                title_item = rss_soup.new_tag("title")
-                title_item.string = entry_title.get_text(strip=True)
-                item_tag.append(title_item)
-
-            # 2) <link>
-            alt_link = entry.find("link", rel="alternate")
-            if alt_link and alt_link.has_attr("href"):
-                link_item = rss_soup.new_tag("link")
-                link_item.string = alt_link["href"]
-                item_tag.append(link_item)
-
-            # 3) <pubDate> (convert from <published> or <updated> to RFC822)
-            #    Example Atom date: 2017-06-28T08:15:00.001-07:00
-            #    Example RSS date: Wed, 28 Jun 2017 08:15:00 -0700
-            published_tag = entry.find("published")
-            updated_tag = entry.find("updated")
-            date_str = None
-            if published_tag and published_tag.string:
-                date_str = published_tag.string.strip()
-            elif updated_tag and updated_tag.string:
-                date_str = updated_tag.string.strip()
-
-            if date_str:
-                try:
-                    # Parse the Atom date with dateutil
-                    dt = date_parser.isoparse(date_str)
-                    # Format as RFC 822
-                    rfc_822_date = email_utils.format_datetime(dt)
-                    pub_date = rss_soup.new_tag("pubDate")
-                    pub_date.string = rfc_822_date
-                    item_tag.append(pub_date)
-                except Exception:
-                    pass
-
-            # 4) <content:encoded> with CDATA
-            content_tag = entry.find("content")
-            if content_tag and content_tag.string:
-                raw_html = content_tag.string
-                # Wrap in CDATA:
-                # Guard if raw_html might contain "]]>" already
-                safe_html = raw_html.replace("]]>", "]]]]><![CDATA[>")
-                cdata_str = f"<![CDATA[{safe_html}]]>"
-
-                content_encoded = rss_soup.new_tag("content:encoded")
-                content_encoded.string = cdata_str
-                item_tag.append(content_encoded)
-
-            channel_tag.append(item_tag)
-            count_items += 1
-
-        # Write the final RSS
+        header_written = False
         try:
-            with open(self.output_file_path, "w", encoding="utf-8") as f_out:
-                # Use prettify() or str(rss_soup)
-                f_out.write(str(rss_soup.prettify()))
+            with f_in, f_out, etree.xmlfile(f_out, encoding="utf-8") as xf:
+                xf.write_declaration()
+                # Add the content:encoded namespace for RSS
+                with xf.element("rss", {"version": "2.0"}, nsmap={"content": CONTENT_NS}):
+                    xf.write("\n")
+                    with xf.element("channel"):
+                        xf.write("\n")
+                        # Bind the per-entry conversion once, outside the loop
+                        build_item = self.build_item
+                        feed_events = parse_feed(f_in)
+                        for _, elem in iter_feed(feed_events):
+                            parent = elem.getparent()
+                            if parent is None or parent.getparent() is not None:
+                                # Not a direct child of <feed> (e.g. an entry's own <title>)
+                                continue
+
+                            tag = elem.tag
+                            if tag == ATOM_ENTRY:
+                                # Atom puts feed metadata before the entries, so the
+                                # channel header is complete by the first <entry>
+                                if not header_written:
+                                    for header_elem in channel_header:
+                                        xf.write(header_elem, pretty_print=True)
+                                    header_written = True
+                                xf.write(build_item(elem), pretty_print=True)
+                                count_items += 1
+                                # Drop the converted entry and everything before it
+                                elem.clear()
+                                while elem.getprevious() is not None:
+                                    del parent[0]
+                            elif tag in header_seen:
+                                # Only the first feed-level title/link/subtitle counts
+                                continue
+                            elif tag == ATOM_TITLE:
+                                header_seen.add(tag)
+                                title_elem.text = "".join(elem.itertext()).strip()
+                            elif tag == ATOM_LINK:
+                                if elem.get("rel") == "alternate":
+                                    header_seen.add(tag)
+                                    href = elem.get("href")
+                                    if href:
+                                        link_elem.text = href
+                            elif tag == ATOM_SUBTITLE:
+                                header_seen.add(tag)
+                                desc_elem.text = "".join(elem.itertext()).strip()
+
+                        if not header_written:
+                            for header_elem in channel_header:
+                                xf.write(header_elem, pretty_print=True)
+                    xf.write("\n")
+
+            # Keep the permissions of the file being replaced; a new file gets
+            # the usual 0644 rather than the temporary file's private 0600
+            try:
+                shutil.copymode(output_file_path, f_out.name)
+            except FileNotFoundError:
+                os.chmod(f_out.name, 0o644)
+            os.replace(f_out.name, output_file_path)
+        except etree.XMLSyntaxError as e:
+            self.master.after(0, self.log, f"ERROR parsing XML: {e}")
+            self.master.after(0, messagebox.showerror, "XML Parse Error", str(e))
+            return
+        except FeedReadError as e:
+            self.master.after(0, self.log, f"ERROR reading input file: {e}")
+            self.master.after(0, messagebox.showerror, "File Read Error", str(e))
+            return
+        except OSError as e:
+            self.master.after(0, self.log, f"ERROR writing output file: {e}")
+            self.master.after(0, messagebox.showerror, "Write Error", str(e))
+            return
         except Exception as e:
-            self.log(f"ERROR writing output file: {e}")
-            messagebox.showerror("Write Error", str(e))
+            self.master.after(0, self.log, f"ERROR converting feed: {e}")
+            self.master.after(0, messagebox.showerror, "Conversion Error", str(e))
             return
+        finally:
+            # Nothing is left to clean up once the temporary file was moved into place
+            if os.path.exists(f_out.name):
+                os.remove(f_out.name)
+
+        parse_errors = feed_events.error_log
+        if parse_errors:
+            self.master.after(0, self.log, f"WARNING: recovered from {len(parse_errors)} XML error(s), "
+                                           f"first: {parse_errors[0].message}")
 
         msg = f"Successfully created RSS 2.0 feed with {count_items} <item> entries."
-        self.log(msg)
-        messagebox.showinfo("Done", msg)
+        self.master.after(0, self.log, msg)
+        self.master.after(0, messagebox.showinfo, "Done", msg)
 
 def main():
     root = tk.Tk()